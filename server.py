@@ -1,10 +1,21 @@
+import atexit
+import collections
+import contextlib
 import logging
+import pathlib
+import queue
 import sqlite3
+import threading
+import time
+import types
 import uuid
 import os
 import functools
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import hmac
+import itertools
+from concurrent.futures import Future
+import orjson
+from flask import Flask, request
 from typing import Optional, Callable
 from dotenv import load_dotenv
 
@@ -24,11 +35,12 @@ FRONTEND_URL = "https://sacandaga.fly.dev"
 ORIGINS = [FRONTEND_URL] if IS_PROD else ["*"]
 
 BEARER_TOKEN = os.environ.get("BEARER_TOKEN", None)
+_EXPECTED_TOKEN = BEARER_TOKEN.encode() if BEARER_TOKEN else None
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO if IS_PROD else logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-logger.info(f"Starting server in {'production' if IS_PROD else 'development'} mode...")
+logger.info("Starting server in %s mode...", "production" if IS_PROD else "development")
 
 # --- Database Setup ---
 
@@ -37,65 +49,425 @@ if IS_PROD:
 else:
     DB_NAME = "calendar_events.db"
 
+# Number of read-only connections kept open for the read endpoints.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+if DB_POOL_SIZE < 1:
+    # With no readers every read would block forever waiting on the pool
+    raise ValueError(f"DB_POOL_SIZE must be at least 1, got {DB_POOL_SIZE}")
+
+# Static SQL is built once at import time so requests reuse identical statement
+# text, which hits the per-connection prepared statement cache. Connections set
+# no row_factory, so rows come back as plain tuples in EVENT_COLUMNS order.
+EVENT_COLUMNS = ("id", "title", "background_color", "start", "end", "description")
+_COLUMN_LIST = ", ".join(EVENT_COLUMNS)
+
+# Rows are stored in random id order, so the list is sorted explicitly; the
+# idx_events_range index on (start, end) serves the ORDER BY.
+SQL_SELECT_ALL = f"SELECT {_COLUMN_LIST} FROM events ORDER BY start, end"
+SQL_SELECT_BY_ID = f"SELECT {_COLUMN_LIST} FROM events WHERE id = ?"
+SQL_INSERT = f"INSERT INTO events ({_COLUMN_LIST}) VALUES (?, ?, ?, ?, ?, ?)"
+SQL_DELETE = "DELETE FROM events WHERE id = ? RETURNING id"
+
+# One UPDATE statement per non-empty combination of updatable fields, indexed
+# by the bitmask of fields present in a PATCH body (bit i = UPDATABLE_FIELDS[i]).
+UPDATABLE_FIELDS = ("title", "background_color", "start", "end", "description")
+UPDATE_FIELD_BITS = {field: 1 << index for index, field in enumerate(UPDATABLE_FIELDS)}
+SQL_UPDATE = [None] + [
+    (
+        "UPDATE events SET "
+        + ", ".join(
+            f"{field} = ?" for field, bit in UPDATE_FIELD_BITS.items() if mask & bit
+        )
+        + f" WHERE id = ? RETURNING {_COLUMN_LIST}"
+    )
+    for mask in range(1, 1 << len(UPDATABLE_FIELDS))
+]
+
+# Seconds between background runs of PRAGMA optimize.
+OPTIMIZE_INTERVAL = 900
+
+# Seconds close() waits for the writer thread to finish before giving up.
+CLOSE_TIMEOUT = 5
+
+# Writes that queue up while the writer is busy are committed together, up to
+# WRITE_BATCH_SIZE statements per transaction.
+WRITE_BATCH_SIZE = 64
 
-def get_db_connection():
-    """Establishes a connection to the SQLite database."""
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row  # Allows accessing columns by name
+
+def _connect(database: str = DB_NAME, uri: bool = False):
+    """Opens and configures a new connection to the SQLite database."""
+    conn = sqlite3.connect(
+        database,
+        uri=uri,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
+    # Per-connection settings; the WAL journal mode itself is persisted in the
+    # database file by init_db. busy_timeout waits for a competing lock instead
+    # of failing immediately with "database is locked".
+    conn.execute("PRAGMA busy_timeout=30000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
-def init_db():
-    """Initializes the database and creates the events table if it doesn't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+class SqliteExecutor:
+    """Runs SQLite I/O off the request threads.
+
+    Writes are queued to a single writer thread that owns the read-write
+    connection. Writes that queue up during a commit are run together in the
+    next transaction, so concurrent writers share one lock acquisition and
+    one WAL append instead of paying for each separately. Reads
+    borrow a connection from a pool of read-only connections, which WAL mode
+    lets run concurrently with the writer.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        readers: int = DB_POOL_SIZE,
+        max_batch: int = WRITE_BATCH_SIZE,
+    ):
+        # Each connection keeps a private page cache. SQLite's shared-cache
+        # mode would make readers take table locks against the writer (and,
+        # with read_uncommitted, see its uncommitted batches); instead, every
+        # connection maps the file with mmap_size, so pages are shared via
+        # the OS page cache rather than copied into each connection.
+        database_uri = pathlib.Path(database).resolve().as_uri()
+        # LIFO so the most recently used connection, whose page cache is
+        # warmest, is handed out first
+        self._reader_pool: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(readers):
+            self._reader_pool.put(_connect(f"{database_uri}?mode=ro", uri=True))
+
+        self._max_batch = max_batch
+        self._closed = False
+        # Serializes the closed check in submit_write with close(), so no write
+        # can be queued behind the writer's stop sentinel
+        self._close_lock = threading.Lock()
+        self._writer_conn = _connect(f"{database_uri}?mode=rwc", uri=True)
+        self._writer_q: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="sqlite-writer", daemon=True
+        )
+        self._writer.start()
+
+    @contextlib.contextmanager
+    def reader(self):
+        """Borrows a read-only connection from the pool for the duration of a block."""
+        conn = self._reader_pool.get()
+        try:
+            yield conn
+        finally:
+            self._reader_pool.put(conn)
+            # A reader borrowed while close() ran is closed once returned
+            if self._closed:
+                self._close_idle_readers()
+
+    def submit_write(self, sql: str, params=(), many: bool = False) -> Future:
+        """Queues a write; the future resolves to its returned rows once committed."""
+        future = Future()
+        with self._close_lock:
+            if self._closed:
+                future.set_exception(RuntimeError("SqliteExecutor is closed"))
+            else:
+                self._writer_q.put((sql, params, many, future))
+        return future
+
+    def close(self):
+        """Refreshes planner statistics, stops the writer and closes all connections."""
+        optimize = self.submit_write("PRAGMA optimize")
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            # The writer exits on the None sentinel after finishing every write
+            # queued ahead of it; only then is its connection safe to close
+            self._writer_q.put(None)
+        self._writer.join(timeout=CLOSE_TIMEOUT)
+        if self._writer.is_alive():
+            logger.warning(
+                "SQLite writer did not stop within %ss; leaving it open", CLOSE_TIMEOUT
+            )
+        else:
+            error = optimize.exception()
+            if error is not None:
+                logger.warning("PRAGMA optimize failed on close: %s", error)
+            self._writer_conn.close()
+        self._close_idle_readers()
+
+    def _close_idle_readers(self):
+        while True:
+            try:
+                self._reader_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _write_loop(self):
+        while True:
+            # Block for the first write, then take whatever else is already
+            # queued without waiting, so an idle write is committed at once
+            job = self._writer_q.get()
+            if job is None:
+                return
+            batch = [job]
+            while len(batch) < self._max_batch:
+                try:
+                    job = self._writer_q.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    # Run what was collected before stopping
+                    self._writer_q.put(None)
+                    break
+                batch.append(job)
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                # Never let the writer thread die, or every later write would
+                # wait forever on a future nobody resolves
+                logger.exception("Unexpected error in SQLite writer: %s", e)
+                for _, _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _run_batch(self, batch: list):
+        """Runs a batch of writes in one transaction, each isolated in a savepoint."""
+        conn = self._writer_conn
+        outcomes = []
+        try:
+            # The connection is in autocommit mode, so "with conn" does not open
+            # a transaction itself, but it commits or rolls back the one begun here
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for (sql, many), group in itertools.groupby(
+                    batch, key=lambda job: (job[0], job[2])
+                ):
+                    jobs = list(group)
+                    if many and len(jobs) > 1:
+                        # Merge consecutive bulk writes of the same statement into a
+                        # single executemany; on failure fall back to one at a time
+                        # so only the offending write is rejected
+                        try:
+                            rows = [row for job in jobs for row in job[1]]
+                            self._execute(conn, sql, rows, many=True)
+                            outcomes.extend((job[3], [], None) for job in jobs)
+                            continue
+                        except Exception:
+                            pass
+                    for _, params, _, future in jobs:
+                        try:
+                            rows = self._execute(conn, sql, params, many)
+                            outcomes.append((future, rows, None))
+                        except Exception as e:
+                            outcomes.append((future, None, e))
+        except Exception as e:
+            # A failed COMMIT can leave the transaction open
+            with contextlib.suppress(sqlite3.Error):
+                if conn.in_transaction:
+                    conn.rollback()
+            for _, _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        # Only report results once the whole batch is committed
+        for future, rows, error in outcomes:
+            if error is None:
+                future.set_result(rows)
+            else:
+                future.set_exception(error)
+
+    @staticmethod
+    def _execute(conn: sqlite3.Connection, sql: str, params, many: bool):
+        """Executes one write in a savepoint, rolling back only that write on error."""
+        conn.execute("SAVEPOINT write")
+        try:
+            if many:
+                conn.executemany(sql, params)
+                rows = []
+            else:
+                rows = conn.execute(sql, params).fetchall()
+        except Exception:
+            conn.execute("ROLLBACK TO write")
+            conn.execute("RELEASE write")
+            raise
+        conn.execute("RELEASE write")
+        return rows
+
+
+def insert_events(events: list[dict]):
+    """Inserts a list of events with a single executemany on the writer thread."""
+    rows = [
+        (
+            event["id"].bytes,
+            event["title"],
+            event["background_color"],
+            event["start"],
+            event["end"],
+            event.get("description"),
+        )
+        for event in events
+    ]
+    db_executor.submit_write(SQL_INSERT, rows, many=True).result()
+
+
+# Bumped whenever the events table layout changes; stored in the database's
+# user_version so init_db knows whether an existing table must be rebuilt.
+# 1: WITHOUT ROWID table
+# 2: ids stored as 16-byte UUID blobs instead of 36-character text
+SCHEMA_VERSION = 2
+
+
+def _create_events_table(cursor: sqlite3.Cursor, name: str = "events"):
+    """Creates an events table with the current schema."""
+    # WITHOUT ROWID stores rows directly in the primary key B-tree, so a lookup
+    # by id is a single tree traversal instead of index -> rowid -> row.
     cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS events (
-            id TEXT PRIMARY KEY,
+        f"""
+        CREATE TABLE {name} (
+            id BLOB PRIMARY KEY,
             title TEXT NOT NULL,
             background_color TEXT NOT NULL,
             start TEXT NOT NULL,
             end TEXT NOT NULL,
             description TEXT
-        )
+        ) WITHOUT ROWID
     """
     )
-    conn.commit()
-    conn.close()
+
+
+def _migrate_events_table(cursor: sqlite3.Cursor, version: int):
+    """Rebuilds an events table from an older schema version in place."""
+    _create_events_table(cursor, "events_new")
+    columns = list(EVENT_COLUMNS)
+    if version < 2:
+        cursor.connection.create_function(
+            "uuid_to_blob", 1, lambda text: uuid.UUID(text).bytes, deterministic=True
+        )
+        columns[0] = "uuid_to_blob(id)"
+    cursor.execute(
+        f"INSERT INTO events_new ({_COLUMN_LIST}) "
+        f"SELECT {', '.join(columns)} FROM events"
+    )
+    cursor.execute("DROP TABLE events")
+    cursor.execute("ALTER TABLE events_new RENAME TO events")
+
+
+def _optimize_loop():
+    """Periodically lets SQLite refresh its query planner statistics."""
+    while True:
+        time.sleep(OPTIMIZE_INTERVAL)
+        try:
+            db_executor.submit_write("PRAGMA optimize").result()
+        except Exception as e:
+            logger.error("PRAGMA optimize failed: %s", e, exc_info=True)
+
+
+def init_db():
+    """Initializes the database, creating or migrating the events table as needed."""
+    with contextlib.closing(_connect()) as conn:
+        cursor = conn.cursor()
+        # WAL lets readers proceed while a write is in progress and turns each
+        # commit into a single sequential append to the log.
+        cursor.execute("PRAGMA journal_mode=WAL")
+
+        # "with conn" commits the migration or rolls it back on error
+        with conn:
+            cursor.execute("BEGIN IMMEDIATE")
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            table_exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+            ).fetchone()
+
+            if not table_exists:
+                _create_events_table(cursor)
+            elif version < SCHEMA_VERSION:
+                logger.info(
+                    "Migrating events table from schema version %d to %d...",
+                    version,
+                    SCHEMA_VERSION,
+                )
+                _migrate_events_table(cursor, version)
+
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_range ON events (start, end)"
+            )
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     logger.info("Database initialized successfully.")
 
 
 # --- Flask App Setup ---
 app = Flask(APP_NAME)
-CORS(
-    app,
-    origins=ORIGINS,
-    methods=["GET", "POST", "PATCH", "DELETE"],
-    supports_credentials=False,
+
+# ORIGINS holds a single entry, so the CORS headers are the same for every
+# response and can be built once instead of per request. Only preflights need
+# to advertise the allowed methods and headers; Max-Age lets browsers reuse a
+# preflight instead of sending one before every cross-origin write.
+CORS_METHODS = ("GET", "POST", "PATCH", "DELETE")
+
+_CORS_HEADERS = types.MappingProxyType(
+    {"Access-Control-Allow-Origin": ORIGINS[0], "Vary": "Origin"}
+)
+_PREFLIGHT_HEADERS = types.MappingProxyType(
+    {
+        **_CORS_HEADERS,
+        "Access-Control-Allow-Methods": ", ".join(CORS_METHODS),
+        "Access-Control-Allow-Headers": "Authorization, Content-Type",
+        "Access-Control-Max-Age": "7200",
+    }
 )
 
+
+@app.before_request
+def cors_preflight():
+    """Answers CORS preflight requests directly with a static 204 response."""
+    if request.method == "OPTIONS":
+        return "", 204, _PREFLIGHT_HEADERS
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Attaches the static CORS headers to every response."""
+    response.headers.update(_CORS_HEADERS)
+    return response
+
+
 # Initialize the database when the application module is loaded.
 # This ensures it runs when Gunicorn starts, before any requests are handled.
 init_db()
+db_executor = SqliteExecutor(DB_NAME)
+atexit.register(db_executor.close)
+threading.Thread(target=_optimize_loop, name="sqlite-optimize", daemon=True).start()
 
 # --- Helper Functions ---
 
 
+def json_response(data, status_code=200):
+    """Serializes data with orjson into a JSON response."""
+    return app.response_class(
+        orjson.dumps(data), status=status_code, mimetype="application/json"
+    )
+
+
 def success_response(data, status_code=200):
-    """Creates a standardized success response tuple for Flask routes."""
-    return jsonify(data), status_code
+    """Creates a standardized success response for Flask routes."""
+    return json_response(data, status_code)
 
 
 def error_response(
     message="An internal server error occurred",
     status_code=500,
-    log_error=Optional[str],
+    log_error: Optional[str] = None,
 ):
-    """Creates a standardized error response tuple for Flask routes."""
+    """Creates a standardized error response for Flask routes."""
     if log_error:
-        logger.error(f"{message}: {log_error}", exc_info=True)
-    return jsonify({"error": message}), status_code
+        logger.error("%s: %s", message, log_error, exc_info=True)
+    return json_response({"error": message}, status_code)
 
 
 def validate_bearer_token(f: Callable):
@@ -117,12 +489,13 @@ def validate_bearer_token(f: Callable):
         if not auth_header:
             return error_response("Authorization header missing", 401)
 
-        parts = auth_header.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        # The auth scheme is case-insensitive; the token itself is compared
+        # byte-for-byte in constant time
+        if auth_header[:7].lower() != "bearer ":
             return error_response("Invalid authorization header format", 401)
 
-        token = parts[1].lower()
-        if token != BEARER_TOKEN:
+        token = auth_header[7:].strip().encode()
+        if not hmac.compare_digest(token, _EXPECTED_TOKEN):
             return error_response("Invalid bearer token", 401)
 
         return f(*args, **kwargs)
@@ -130,11 +503,200 @@ def validate_bearer_token(f: Callable):
     return decorated_function
 
 
-def event_to_dict(event_row: Optional[sqlite3.Row]):
-    """Converts a database row (sqlite3.Row) to a dictionary."""
+REQUIRED_EVENT_FIELDS = ("title", "background_color", "start", "end")
+
+
+def _compile_function(name: str, lines: list[str]) -> Callable:
+    """Compiles generated source lines into a module-level function."""
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+
+# Validators for the fixed event schema are generated once at import time as
+# straight-line code, with no per-request loop over the field names.
+find_missing_field = _compile_function(
+    "find_missing_field",
+    [
+        "def find_missing_field(data):",
+        '    """Returns the first missing or empty required field, if any."""',
+        "    get = data.get",
+    ]
+    + [
+        f"    if not get({field!r}):\n        return {field!r}"
+        for field in REQUIRED_EVENT_FIELDS
+    ]
+    + ["    return None"],
+)
+
+update_field_mask = _compile_function(
+    "update_field_mask",
+    [
+        "def update_field_mask(data):",
+        '    """Returns the UPDATE_FIELD_BITS mask of the fields present."""',
+        "    mask = 0",
+    ]
+    + [
+        f"    if {field!r} in data:\n        mask |= {bit}"
+        for field, bit in UPDATE_FIELD_BITS.items()
+    ]
+    + ["    return mask"],
+)
+
+
+def parse_json_body():
+    """Parses the raw request body with orjson (None if it isn't valid JSON)."""
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+
+
+def mint_uuids(count: int) -> list[uuid.UUID]:
+    """Generates random (version 4) UUIDs from a single os.urandom call."""
+    raw = os.urandom(16 * count)
+    return [
+        uuid.UUID(bytes=raw[offset : offset + 16], version=4)
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
+# Pre-minted UUIDs for single event creation, refilled UUID_POOL_SIZE at a time
+# so most requests skip the urandom syscall. Cleared on fork so that worker
+# processes never hand out the same ids.
+UUID_POOL_SIZE = 256
+_uuid_pool: collections.deque = collections.deque()
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def new_uuid() -> uuid.UUID:
+    """Returns a random (version 4) UUID from the pre-minted pool."""
+    while True:
+        try:
+            return _uuid_pool.popleft()
+        except IndexError:
+            _uuid_pool.extend(mint_uuids(UUID_POOL_SIZE))
+
+
+def parse_event_id(event_id: str) -> Optional[bytes]:
+    """Converts an event ID from a URL to its stored 16-byte form (None if invalid)."""
+    try:
+        parsed = uuid.UUID(event_id)
+    except ValueError:
+        return None
+    # Only the canonical form is accepted, as with the original text ids, so
+    # each event has exactly one URL and therefore one response cache key
+    return parsed.bytes if str(parsed) == event_id else None
+
+
+def event_to_dict(event_row: Optional[tuple]):
+    """Converts a database row tuple (in EVENT_COLUMNS order) to a dictionary."""
     if event_row is None:
         return None
-    return dict(event_row)
+    # The id blob becomes a UUID, which orjson emits in its hyphenated form
+    return dict(zip(EVENT_COLUMNS, (uuid.UUID(bytes=event_row[0]), *event_row[1:])))
+
+
+# --- Response Cache ---
+
+# Time-to-live in seconds for each cache policy. Writes through the API
+# invalidate affected entries, so the TTL only bounds staleness from changes
+# made to the database outside the app.
+CACHE_POLICIES = {"long": 900}
+
+# Upper bound on cached responses; the oldest entry is evicted first.
+CACHE_MAX_ENTRIES = 500
+
+# Maps request path -> (expires_at, body, status, mimetype). Expired entries are
+# kept so they can be served as a stale fallback if the database errors out.
+_response_cache: dict[str, tuple[float, bytes, int, str]] = {}
+
+# Bumped on every write (via invalidate_cached_responses). A response computed
+# concurrently with a write is never stored after the write has invalidated
+# the cache, and the value doubles as the ETag version of the events list.
+_data_version = 0
+_cache_lock = threading.Lock()
+
+# The serialized GET /event body with the data version it was built at. It is
+# served as-is until a write bumps the version, so it needs no TTL or explicit
+# invalidation.
+_all_events_cache: Optional[tuple[int, bytes]] = None
+
+# Random per-process ETag prefix, so versions counted by an earlier run of the
+# server never match the current one.
+_ETAG_PREFIX = os.urandom(4).hex()
+
+
+def cached(policy: str = "long"):
+    """Decorator to cache successful GET responses in memory, keyed on request path."""
+    ttl = CACHE_POLICIES[policy]
+
+    def decorator(f: Callable):
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            key = request.path
+            entry = _response_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return app.response_class(entry[1], entry[2], mimetype=entry[3])
+
+            generation = _data_version
+            response = app.make_response(f(*args, **kwargs))
+
+            if response.status_code == 200:
+                with _cache_lock:
+                    if generation == _data_version:
+                        _response_cache.pop(key, None)
+                        if len(_response_cache) >= CACHE_MAX_ENTRIES:
+                            del _response_cache[next(iter(_response_cache))]
+                        _response_cache[key] = (
+                            time.monotonic() + ttl,
+                            response.get_data(),
+                            response.status_code,
+                            response.mimetype,
+                        )
+            elif response.status_code >= 500 and entry is not None:
+                logger.warning("Serving stale cached response for %s", key)
+                return app.response_class(entry[1], entry[2], mimetype=entry[3])
+
+            return response
+
+        return decorated_function
+
+    return decorator
+
+
+def invalidate_cached_responses(*paths: str):
+    """Records a write: drops the given cached paths and bumps the data version.
+
+    The version bump alone invalidates the GET /event body and its ETag, so
+    only per-event paths need to be passed.
+    """
+    global _data_version
+    with _cache_lock:
+        _data_version += 1
+        for path in paths:
+            _response_cache.pop(path, None)
+
+
+def etagged(f: Callable):
+    """Decorator to ETag GET responses by data version, answering 304 if unchanged."""
+
+    @functools.wraps(f)
+    def decorated_function(*args, **kwargs):
+        etag = f"{_ETAG_PREFIX}-{_data_version}"
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+        response.set_etag(etag, weak=True)
+        # Let clients keep the body but revalidate it on every use
+        response.cache_control.no_cache = True
+        return response
+
+    return decorated_function
 
 
 # --- API Endpoints ---
@@ -162,37 +724,63 @@ def login():
 
 
 @app.route("/event", methods=["GET"])
+@etagged
 def get_all_events():
     """Returns a list of all events."""
+    global _all_events_cache
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM events")
-        events_rows = cursor.fetchall()
-        conn.close()
-
-        events = [event_to_dict(row) for row in events_rows]
-        return success_response(events)
+        # Read the version before querying so the stored body is never older
+        # than the version it is tagged with
+        version = _data_version
+        cache = _all_events_cache
+        if cache is not None and cache[0] == version:
+            return app.response_class(cache[1], mimetype="application/json")
+
+        with db_executor.reader() as conn:
+            events_rows = conn.execute(SQL_SELECT_ALL).fetchall()
+
+        # Unpack each row straight into a dict literal (keys in EVENT_COLUMNS
+        # order), skipping the intermediate zip and tuple per row
+        body = orjson.dumps(
+            [
+                {
+                    "id": uuid.UUID(bytes=event_id),
+                    "title": title,
+                    "background_color": color,
+                    "start": start,
+                    "end": end,
+                    "description": description,
+                }
+                for event_id, title, color, start, end, description in events_rows
+            ]
+        )
+        _all_events_cache = (version, body)
+        return app.response_class(body, mimetype="application/json")
     except Exception as e:
         return error_response("Error fetching all events", log_error=e)
 
 
 @app.route("/event/<string:event_id>", methods=["GET"])
+@cached(policy="long")
 def get_event_by_id(event_id: str):
     """Returns a single event by its ID."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM events WHERE id = ?", (event_id,))
-        event_row = cursor.fetchone()
-        conn.close()
+        event_key = parse_event_id(event_id)
+        if event_key is None:
+            return error_response(
+                f"Event with ID {event_id} not found", status_code=404
+            )
 
-        if event_row is None:
+        # Read the result fully so the pooled connection's read transaction ends
+        with db_executor.reader() as conn:
+            event_rows = conn.execute(SQL_SELECT_BY_ID, (event_key,)).fetchall()
+
+        if not event_rows:
             return error_response(
                 f"Event with ID {event_id} not found", status_code=404
             )
 
-        return success_response(event_to_dict(event_row))
+        return success_response(event_to_dict(event_rows[0]))
     except Exception as e:
         return error_response(
             f"Error fetching event by ID {event_id}: {e}", log_error=e
@@ -204,20 +792,19 @@ def get_event_by_id(event_id: str):
 def create_event():
     """Creates a new event."""
     try:
-        data = request.get_json()
-        if not data:
+        data = parse_json_body()
+        if not data or not isinstance(data, dict):
             return error_response("Invalid JSON body payload", status_code=400)
 
         # Validate required fields
-        required_fields = ["title", "background_color", "start", "end"]
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return error_response(
-                    f"Missing or empty required field: {field}", status_code=400
-                )
+        missing_field = find_missing_field(data)
+        if missing_field:
+            return error_response(
+                f"Missing or empty required field: {missing_field}", status_code=400
+            )
 
         new_event = {
-            "id": str(uuid.uuid4()),
+            "id": new_uuid(),
             "title": data["title"],
             "background_color": data["background_color"],
             "start": data["start"],
@@ -225,85 +812,91 @@ def create_event():
             "description": data.get("description"),  # Optional field
         }
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO events (id, title, background_color, start, end, description)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (
-                new_event["id"],
-                new_event["title"],
-                new_event["background_color"],
-                new_event["start"],
-                new_event["end"],
-                new_event["description"],
-            ),
-        )
-        conn.commit()
-        conn.close()
+        insert_events([new_event])
+        invalidate_cached_responses()
 
         return success_response(new_event, 201)
     except Exception as e:
         return error_response(f"Error creating event: {e}", log_error=e)
 
 
+@app.route("/event/batch", methods=["POST"])
+@validate_bearer_token
+def create_events_batch():
+    """Creates multiple events in a single transaction."""
+    try:
+        data = parse_json_body()
+        if not data or not isinstance(data, list):
+            return error_response(
+                "Expected a non-empty JSON array of events", status_code=400
+            )
+
+        # Validate required fields of every event before inserting any
+        for index, item in enumerate(data):
+            if not isinstance(item, dict):
+                return error_response(
+                    f"Invalid event at index {index}", status_code=400
+                )
+            missing_field = find_missing_field(item)
+            if missing_field:
+                return error_response(
+                    f"Missing or empty required field at index {index}: "
+                    f"{missing_field}",
+                    status_code=400,
+                )
+
+        new_events = [
+            {
+                "id": event_id,
+                "title": item["title"],
+                "background_color": item["background_color"],
+                "start": item["start"],
+                "end": item["end"],
+                "description": item.get("description"),  # Optional field
+            }
+            for event_id, item in zip(mint_uuids(len(data)), data)
+        ]
+
+        insert_events(new_events)
+        invalidate_cached_responses()
+
+        return success_response(new_events, 201)
+    except Exception as e:
+        return error_response(f"Error creating events: {e}", log_error=e)
+
+
 @app.route("/event/<string:event_id>", methods=["PATCH"])
 @validate_bearer_token
 def update_event(event_id: str):
     """Updates an existing event."""
     try:
-        data = request.get_json()
-        if not data:
-            return error_response("Invalid JSON body payload", status_code=400)
-
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Check if event exists
-        cursor.execute("SELECT * FROM events WHERE id = ?", (event_id,))
-        existing_event = cursor.fetchone()
-        if existing_event is None:
-            conn.close()
+        event_key = parse_event_id(event_id)
+        if event_key is None:
             return error_response(
                 f"Event with ID {event_id} not found", status_code=404
             )
 
-        # Build the update query dynamically
-        update_fields = []
-        update_values = []
-
-        if "title" in data:
-            update_fields.append("title = ?")
-            update_values.append(data["title"])
-        if "background_color" in data:
-            update_fields.append("background_color = ?")
-            update_values.append(data["background_color"])
-        if "start" in data:
-            update_fields.append("start = ?")
-            update_values.append(data["start"])
-        if "end" in data:
-            update_fields.append("end = ?")
-            update_values.append(data["end"])
-        if "description" in data:  # Can be None to clear description
-            update_fields.append("description = ?")
-            update_values.append(data.get("description"))
-
-        if not update_fields:
-            conn.close()
-            return error_response("No fields to update provided", status_code=400)
+        data = parse_json_body()
+        if not data or not isinstance(data, dict):
+            return error_response("Invalid JSON body payload", status_code=400)
 
-        query = f"UPDATE events SET {', '.join(update_fields)} WHERE id = ?"
-        update_values.append(event_id)
+        mask = update_field_mask(data)
+        if not mask:
+            return error_response("No fields to update provided", status_code=400)
 
-        cursor.execute(query, tuple(update_values))
-        conn.commit()
+        query = SQL_UPDATE[mask]
+        # Values follow the field order the statement was built with;
+        # description can be None to clear it
+        update_values = [data[field] for field in UPDATABLE_FIELDS if field in data]
+        update_values.append(event_key)
 
-        # Fetch the updated event
-        cursor.execute("SELECT * FROM events WHERE id = ?", (event_id,))
-        updated_event_row = cursor.fetchone()
-        conn.close()
+        updated_event_rows = db_executor.submit_write(query, update_values).result()
+        if not updated_event_rows:
+            return error_response(
+                f"Event with ID {event_id} not found", status_code=404
+            )
+        updated_event_row = updated_event_rows[0]
+        invalidate_cached_responses(f"/event/{event_id}")
 
         return success_response(event_to_dict(updated_event_row))
     except Exception as e:
@@ -315,22 +908,18 @@ def update_event(event_id: str):
 def delete_event(event_id: str):
     """Deletes an event by its ID."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Check if event exists before deleting
-        cursor.execute("SELECT id FROM events WHERE id = ?", (event_id,))
-        event_exists = cursor.fetchone()
-
-        if not event_exists:
-            conn.close()
+        event_key = parse_event_id(event_id)
+        if event_key is None:
             return error_response(
                 f"Event with ID {event_id} not found", status_code=404
             )
 
-        cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
-        conn.commit()
-        conn.close()
+        deleted_rows = db_executor.submit_write(SQL_DELETE, (event_key,)).result()
+        if not deleted_rows:
+            return error_response(
+                f"Event with ID {event_id} not found", status_code=404
+            )
+        invalidate_cached_responses(f"/event/{event_id}")
 
         return success_response({"message": "Event deleted successfully"})
     except Exception as e:
@@ -339,5 +928,5 @@ def delete_event(event_id: str):
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    logger.info(f"Server listening on port {PORT}...")
+    logger.info("Server listening on port %d...", PORT)
     app.run(debug=not IS_PROD, port=PORT)